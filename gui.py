@@ -17,7 +17,7 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool, Qt, QTimer, Signal
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QApplication,
@@ -28,6 +28,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
@@ -38,7 +39,7 @@ from PySide6.QtWidgets import (
     QColorDialog,
 )
 
-from watch_core import WatchDB, TMDBClient, WatchService, AddOrShowResult, TmdbChoice, TitleItem
+from watch_core import WatchDB, TMDBClient, WatchService, AddOrShowResult, TmdbChoice, TitleItem, norm_title
 
 def app_dir() -> Path:
     # In a PyInstaller build, sys.executable is the .exe path
@@ -47,6 +48,7 @@ def app_dir() -> Path:
     return Path(__file__).resolve().parent
 
 DB_PATH = app_dir() / "watchlist.sqlite3"
+LIST_BATCH_SIZE = 128
 
 
 def item_to_display_text(it: TitleItem) -> str:
@@ -58,10 +60,158 @@ def item_to_display_text(it: TitleItem) -> str:
     return f'{it.title}  [{it.type}]  ({seen})  | {year} | {runtime}{genres_part}'
 
 
+class TitleListModel(QAbstractListModel):
+    """List model over TitleItem rows; text and colors are only computed for visible rows."""
+
+    SEEN_COLOR = QColor(170, 170, 170)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: list[TitleItem] = []
+        self._id_to_row: dict[int, int] = {}
+        self._colors: dict[int, QColor] = {}
+        self._blended: dict[int, QColor] = {}
+        # Formatted row text survives resets; drop entries when a title changes
+        self._text_cache: dict[int, str] = {}
+        self._text_seen: dict[int, bool] = {}
+
+    def set_items(self, items: list[TitleItem]):
+        self.beginResetModel()
+        self._items = list(items)
+        self._id_to_row = {it.id: row for row, it in enumerate(self._items)}
+        self.endResetModel()
+
+    def set_tag_colors(self, colors: dict[int, QColor]):
+        # Only K tag colors exist, so blend each once instead of per seen row
+        self._colors = colors
+        self._blended = {tag_id: self.blend_with_grey(c) for tag_id, c in colors.items()}
+
+    def display_text(self, it: TitleItem) -> str:
+        s = self._text_cache.get(it.id)
+        if s is None or it.seen != self._text_seen.get(it.id):
+            s = item_to_display_text(it)
+            self._text_cache[it.id] = s
+            self._text_seen[it.id] = it.seen
+        return s
+
+    def invalidate_text(self, title_id: Optional[int] = None):
+        if title_id is None:
+            self._text_cache.clear()
+            self._text_seen.clear()
+            return
+        self._text_cache.pop(title_id, None)
+        self._text_seen.pop(title_id, None)
+
+    def item_at(self, row: int) -> Optional[TitleItem]:
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+    def row_for_id(self, title_id: int) -> int:
+        return self._id_to_row.get(title_id, -1)
+
+    def update_item(self, it: TitleItem):
+        row = self.row_for_id(it.id)
+        if row < 0:
+            return
+        self._items[row] = it
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        it = self._items[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_text(it)
+        if role == Qt.ItemDataRole.UserRole:
+            return it.id
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.apply_item_style(it.seen, it.tags[0][0] if it.tags else None)
+        return None
+
+    def blend_with_grey(self, color: QColor, factor: float = 0.55) -> QColor:
+        # factor=0 => original, factor=1 => fully grey
+        grey = QColor(160, 160, 160)
+        r = int(color.red()   * (1 - factor) + grey.red()   * factor)
+        g = int(color.green() * (1 - factor) + grey.green() * factor)
+        b = int(color.blue()  * (1 - factor) + grey.blue()  * factor)
+        return QColor(r, g, b)
+
+    def apply_item_style(self, is_seen: bool, tag_id: Optional[int]) -> QColor | None:
+        # No tag color
+        if tag_id is None or tag_id not in self._colors:
+            if is_seen:
+                return self.SEEN_COLOR
+            return None
+
+        # With tag color
+        if is_seen:
+            return self._blended[tag_id]
+        return self._colors[tag_id]
+
+
+
+class TmdbWorker(QRunnable):
+    """Runs a TMDB search on the thread pool and reports back through Qt signals."""
+
+    class WorkerSignals(QObject):
+        # Both carry the search serial so stale results can be dropped
+        finished = Signal(int, list)
+        error = Signal(int, str)
+
+    def __init__(self, service: WatchService, query: str, serial: int, limit: int = 8):
+        super().__init__()
+        self.service = service
+        self.query = query
+        self.serial = serial
+        self.limit = limit
+        self.signals = TmdbWorker.WorkerSignals()
+
+    def run(self):
+        try:
+            choices = self.service.tmdb_search_any(self.query, limit=self.limit)
+        except Exception as e:
+            self.signals.error.emit(self.serial, str(e))
+            return
+        self.signals.finished.emit(self.serial, choices)
+
+
+class TmdbAddWorker(QRunnable):
+    """Fetches TMDB details for a picked choice and stores it, off the GUI thread."""
+
+    class WorkerSignals(QObject):
+        finished = Signal(int, object)  # AddOrShowResult
+        error = Signal(int, str)
+
+    def __init__(self, service: WatchService, choice: TmdbChoice, serial: int):
+        super().__init__()
+        self.service = service
+        self.choice = choice
+        self.serial = serial
+        self.signals = TmdbAddWorker.WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.service.add_or_show_confirm_tmdb_choice(self.choice)
+        except Exception as e:
+            self.signals.error.emit(self.serial, str(e))
+            return
+        self.signals.finished.emit(self.serial, result)
+
 
 class PickDialog(QDialog):
     """Dialog to pick a TMDB choice (movie/show) from a list."""
 
+    _NEWLINE_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+    _LABELS = {"tv": "show", "movie": "movie"}
+
     def __init__(self, choices: list[TmdbChoice], parent: QWidget | None = None):
         super().__init__(parent)
         self.setWindowTitle("Pick a match")
@@ -76,9 +226,9 @@ class PickDialog(QDialog):
 
         self.list = QListWidget()
         for c in choices:
-            label = "show" if c.media_type == "tv" else "movie"
+            label = self._LABELS.get(c.media_type, "movie")
             year = c.year if c.year else "?"
-            overview = (c.overview or "").replace("\n", " ")
+            overview = (c.overview or "").translate(self._NEWLINE_TABLE)
             if len(overview) > 160:
                 overview = overview[:157] + "..."
             text = f"[{label}] {c.title} ({year}) — {overview}"
@@ -152,6 +302,9 @@ class ManageTagsDialog(QDialog):
         layout = QVBoxLayout(self)
 
         self.list = QListWidget()
+        self.list.setUniformItemSizes(True)
+        self.list.setLayoutMode(QListView.Batched)
+        self.list.setBatchSize(LIST_BATCH_SIZE)
         layout.addWidget(self.list)
 
         row = QHBoxLayout()
@@ -268,18 +421,22 @@ class ManageTagsDialog(QDialog):
 
 
 class SetTagsDialog(QDialog):
-    def __init__(self, service, title_id: int, parent=None):
+    def __init__(self, service, title_id: int, colors: Optional[dict[int, QColor]] = None, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Set tags")
         self.setModal(True)
         self.service = service
         self.title_id = title_id
+        self.colors = colors or {}
 
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("Select tags for this media:"))
 
         self.list = QListWidget()
         self.list.setSelectionMode(QListWidget.NoSelection)
+        self.list.setUniformItemSizes(True)
+        self.list.setLayoutMode(QListView.Batched)
+        self.list.setBatchSize(LIST_BATCH_SIZE)
         layout.addWidget(self.list)
 
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -291,13 +448,13 @@ class SetTagsDialog(QDialog):
 
     def populate(self):
         self.list.clear()
-        current_names = {name for name, _color in self.service.get_title_tags(self.title_id)}
+        current_ids = set(self.service.get_title_tag_ids(self.title_id))
         for tag_id, name, color in self.service.list_tags():
             item = QListWidgetItem(name)
             item.setData(Qt.ItemDataRole.UserRole, int(tag_id))
             item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Checked if name in current_names else Qt.Unchecked)
-            item.setForeground(QColor(color))
+            item.setCheckState(Qt.Checked if int(tag_id) in current_ids else Qt.Unchecked)
+            item.setForeground(self.colors.get(tag_id) or QColor(color))
             self.list.addItem(item)
 
     def selected_tag_ids(self) -> list[int]:
@@ -310,6 +467,16 @@ class SetTagsDialog(QDialog):
 
 
 class MainWindow(QWidget):
+    # Sort mode -> (key over (title_lower, runtime, year, item), reverse)
+    _SORT_KEYS = {
+        "Title (A→Z)": (lambda d: d[0], False),
+        "Title (Z→A)": (lambda d: d[0], True),
+        "Runtime (short→long)": (lambda d: (d[1] is None, d[1] or 0, d[0]), False),
+        "Runtime (long→short)": (lambda d: (d[1] is None, -(d[1] or 0), d[0]), False),
+        "Year (recent→oldest)": (lambda d: (d[2] is None, -(d[2] or 0), d[0]), False),
+        "Year (oldest→recent)": (lambda d: (d[2] is None, d[2] or 0, d[0]), False),
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Watchlist")
@@ -322,6 +489,15 @@ class MainWindow(QWidget):
         # TMDB is optional (if token missing, add will fall back to local dialog)
         self.tmdb = TMDBClient()
         self.service = WatchService(db=self.db, tmdb=self.tmdb)
+        self._pool = QThreadPool.globalInstance()
+        self._tmdb_worker: Optional[TmdbWorker] = None
+        self._tmdb_serial = 0
+        # Adds write to the DB, so they are never cancelled; held by serial until they report
+        self._tmdb_add_workers: dict[int, TmdbAddWorker] = {}
+
+        self._color_cache = self._color_by_tag_id()
+        # Genre set only changes when titles are added or deleted
+        self._genres_dirty = True
 
         # --- UI ---
         root = QVBoxLayout(self)
@@ -334,7 +510,12 @@ class MainWindow(QWidget):
         self.input.setPlaceholderText("Type a title and press Enter to search…")
         top.addWidget(self.input)  
 
-        self.input.textChanged.connect(self.on_live_filter)
+        # Coalesce keystrokes: only filter once typing pauses
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filters)
+        self.input.textChanged.connect(self.on_live_text_changed)
 
         self.tmdb_btn = QPushButton("Search TMDB")
         self.tmdb_btn.clicked.connect(self.on_search_tmdb)
@@ -356,19 +537,19 @@ class MainWindow(QWidget):
         filters = QHBoxLayout()
 
         self.unseen_only = QCheckBox("Unseen only")
-        self.unseen_only.stateChanged.connect(self.refresh_list)
+        self.unseen_only.stateChanged.connect(self.on_filters_changed)
         filters.addWidget(self.unseen_only)
 
         filters.addWidget(QLabel("Type:"))
         self.type_filter = QComboBox()
         self.type_filter.addItems(["all", "movie", "show", "youtube"])
-        self.type_filter.currentIndexChanged.connect(self.refresh_list)
+        self.type_filter.currentIndexChanged.connect(self.on_filters_changed)
         filters.addWidget(self.type_filter)
 
         filters.addWidget(QLabel("Genre:"))
         self.genre_filter = QComboBox()
         self.genre_filter.addItems(["all"])
-        self.genre_filter.currentIndexChanged.connect(self.refresh_list)
+        self.genre_filter.currentIndexChanged.connect(self.on_filters_changed)
         filters.addWidget(self.genre_filter)
 
         filters.addWidget(QLabel("Tag:"))
@@ -382,7 +563,7 @@ class MainWindow(QWidget):
         self.limit_box = QSpinBox()
         self.limit_box.setRange(10, 2000)
         self.limit_box.setValue(200)
-        self.limit_box.valueChanged.connect(self.refresh_list)
+        self.limit_box.valueChanged.connect(self.on_filters_changed)
         filters.addWidget(self.limit_box)
 
         filters.addWidget(QLabel("Sort:"))
@@ -395,6 +576,8 @@ class MainWindow(QWidget):
             "Year (recent→oldest)",
             "Year (oldest→recent)",
         ])
+        self._update_sort_key()
+        self.sort_by.currentIndexChanged.connect(self._update_sort_key)
         self.sort_by.currentIndexChanged.connect(self.on_filters_changed)
         filters.addWidget(self.sort_by)
 
@@ -413,8 +596,14 @@ class MainWindow(QWidget):
         filters.addWidget(self.live_local)
 
         # List
-        self.list = QListWidget()
-        self.list.itemSelectionChanged.connect(self.on_selection_changed)
+        self.model = TitleListModel(self)
+        self.model.set_tag_colors(self._color_cache)
+        self.list = QListView()
+        self.list.setUniformItemSizes(True)
+        self.list.setLayoutMode(QListView.Batched)
+        self.list.setBatchSize(LIST_BATCH_SIZE)
+        self.list.setModel(self.model)
+        self.list.selectionModel().currentChanged.connect(lambda _cur, _prev: self.on_selection_changed())
         root.addWidget(self.list, 1)
 
         # Bottom actions
@@ -446,8 +635,7 @@ class MainWindow(QWidget):
         bottom.addStretch(1)
         root.addLayout(bottom)
 
-        # Initial
-        self.refresh_genres()
+        # Initial (refresh_list also fills the genre dropdown)
         self.refresh_list()
         self.refresh_tags()
 
@@ -485,10 +673,10 @@ class MainWindow(QWidget):
         self.tag_filter.clear()
         self.tag_filter.addItem("all")
     
-        for _id, name, color in self.service.list_tags():
+        for tag_id, name, _color in self.service.list_tags():
             self.tag_filter.addItem(name)
             idx = self.tag_filter.count() - 1
-            self.tag_filter.setItemData(idx, QColor(color), Qt.ItemDataRole.ForegroundRole)
+            self.tag_filter.setItemData(idx, self._color_cache[tag_id], Qt.ItemDataRole.ForegroundRole)
     
         idx = self.tag_filter.findText(current)
         if idx >= 0:
@@ -497,9 +685,17 @@ class MainWindow(QWidget):
         self.tag_filter.blockSignals(False)
 
 
-    def on_filters_changed(self):
-        if getattr(self, "live_local", None) and self.live_local.isChecked():
-            self.on_live_filter(self.input.text())
+    def on_filters_changed(self, *_args):
+        # Near-simultaneous filter/sort changes coalesce into one refresh
+        self._filter_timer.start()
+
+    def on_live_text_changed(self, _text: str):
+        if self.live_local.isChecked():
+            self._filter_timer.start()
+
+    def _apply_filters(self):
+        if self.live_local.isChecked() and self.input.text().strip():
+            self._run_live_filter()
         else:
             self.refresh_list()
 
@@ -507,106 +703,62 @@ class MainWindow(QWidget):
     def refresh_list(self):
         unseen, type_, genre, tag, limit = self.current_filters()
         items = self.service.list_titles(unseen_only=unseen, type_=type_, genre=genre, tag=tag, limit=limit)
-        tag_map = self.service.db.get_tags_for_title_ids([it.id for it in items])
-        mode = self.sort_by.currentText()
-
-        if mode == "Title (A→Z)":
-            items.sort(key=lambda it: (it.title or "").lower())
-
-        elif mode == "Title (Z→A)":
-            items.sort(key=lambda it: (it.title or "").lower(), reverse=True)
-
-        elif mode == "Runtime (short→long)":
-            items.sort(
-                key=lambda it: (
-                    it.runtime_minutes is None,
-                    it.runtime_minutes or 0,
-                    (it.title or "").lower(),
-                )
-            )
+        items = self._sort_items(items)
 
-        elif mode == "Runtime (long→short)":
-            items.sort(
-                key=lambda it: (
-                    it.runtime_minutes is None,
-                    -(it.runtime_minutes or 0),
-                    (it.title or "").lower(),
-                )
-            )
-
-        elif mode == "Year (recent→oldest)":
-            items.sort(
-                key=lambda it: (
-                    it.year is None,
-                    -(it.year or 0),
-                    (it.title or "").lower(),
-                )
-            )
+        self._populate_list(items)
+        if self._genres_dirty:
+            self.refresh_genres()
+            self._genres_dirty = False
 
-        elif mode == "Year (oldest→recent)":
-            items.sort(
-                key=lambda it: (
-                    it.year is None,
-                    it.year or 0,
-                    (it.title or "").lower(),
-                )
-            )
+    def _update_sort_key(self):
+        self._sort_key, self._sort_reverse = self._SORT_KEYS.get(
+            self.sort_by.currentText(), self._SORT_KEYS["Title (A→Z)"]
+        )
 
+    def _sort_items(self, items: list[TitleItem]) -> list[TitleItem]:
+        # Decorate once so keys only compare precomputed fields
+        decorated = [((it.title or "").lower(), it.runtime_minutes, it.year, it) for it in items]
+        decorated.sort(key=self._sort_key, reverse=self._sort_reverse)
+        return [d[3] for d in decorated]
 
-        self.list.clear()
-        for it in items:
-            w = QListWidgetItem(item_to_display_text(it))
-            w.setData(Qt.ItemDataRole.UserRole, it.id)
-        
-            tags = tag_map.get(it.id, [])
-            base_color = QColor(tags[0][1]) if tags else None
-        
-            self.apply_item_style(w, it.seen, base_color)
-            self.list.addItem(w)
+    def _color_by_tag_id(self) -> dict[int, QColor]:
+        return {tag_id: QColor(color) for tag_id, _name, color in self.service.list_tags()}
 
+    def _refresh_tag_colors(self):
+        self._color_cache = self._color_by_tag_id()
+        self.model.set_tag_colors(self._color_cache)
 
-        self.refresh_genres()
+    def _populate_list(self, items: list[TitleItem]):
+        # One repaint and no selection signals while the model is reset
+        selection = self.list.selectionModel()
+        self.list.setUpdatesEnabled(False)
+        selection.blockSignals(True)
+        try:
+            self.model.set_items(items)
+        finally:
+            selection.blockSignals(False)
+            self.list.setUpdatesEnabled(True)
         self.on_selection_changed()
 
+    def selected_item(self) -> Optional[TitleItem]:
+        # The model already holds the row's TitleItem; no DB lookup needed
+        return self.model.item_at(self.list.currentIndex().row())
+
     def selected_title_id(self) -> Optional[int]:
-        item = self.list.currentItem()
-        if not item:
+        it = self.selected_item()
+        if not it:
             return None
-        return int(item.data(Qt.ItemDataRole.UserRole))
-
-    def blend_with_grey(self, color: QColor, factor: float = 0.55) -> QColor:
-        # factor=0 => original, factor=1 => fully grey
-        grey = QColor(160, 160, 160)
-        r = int(color.red()   * (1 - factor) + grey.red()   * factor)
-        g = int(color.green() * (1 - factor) + grey.green() * factor)
-        b = int(color.blue()  * (1 - factor) + grey.blue()  * factor)
-        return QColor(r, g, b)
-
-    def apply_item_style(self, qitem, is_seen: bool, base_color: QColor | None):
-        # No tag color
-        if base_color is None:
-            if is_seen:
-                qitem.setForeground(QColor(170, 170, 170))
-            return
-
-        # With tag color
-        if is_seen:
-            qitem.setForeground(self.blend_with_grey(base_color))
-        else:
-            qitem.setForeground(base_color)
+        return it.id
 
 
     # ------------- UI actions -------------        
     def on_delete(self):
-        tid = self.selected_title_id()
-        if not tid:
-            return
-
-        row = self.db.get_by_id(tid)
-        if not row:
+        it = self.selected_item()
+        if not it:
             return
 
-        title = row["title"]
+        tid = it.id
+        title = it.title
         btn = QMessageBox.question(
             self,
             "Delete entry",
@@ -617,6 +769,8 @@ class MainWindow(QWidget):
             return
 
         self.service.delete_title(tid)
+        self.model.invalidate_text(tid)
+        self._genres_dirty = True
         self.refresh_list()
 
 
@@ -625,13 +779,13 @@ class MainWindow(QWidget):
         if not typed:
             return
 
-        matches = self.service.suggestions(typed, limit=25)
+        matches = self.service.suggestions(typed, limit=10)
         if not matches:
             QMessageBox.information(self, "Local search", "No matches in your list.")
             return
 
         # Show matches in a simple dialog list (reuse PickDialog style if you want)
-        text = "\n".join(f"- {item_to_display_text(m)}" for m in matches[:10])
+        text = "\n".join(f"- {item_to_display_text(m)}" for m in matches)
         QMessageBox.information(self, "Local matches (top 10)", text)
 
     def on_search_tmdb(self):
@@ -640,11 +794,43 @@ class MainWindow(QWidget):
             return
         self.input.clear()
 
-        try:
-            choices = self.service.tmdb_search_any(typed, limit=8)
-        except Exception as e:
-            QMessageBox.warning(self, "TMDB error", str(e))
+        worker = TmdbWorker(self.service, typed, self._next_tmdb_serial(), limit=8)
+        worker.signals.finished.connect(self._on_tmdb_results)
+        self._start_tmdb_worker(worker)
+
+    def _next_tmdb_serial(self) -> int:
+        # A new TMDB job supersedes any search in flight: drop it if it hasn't
+        # started, otherwise its result is ignored when it arrives
+        if self._tmdb_worker is not None:
+            self._pool.tryTake(self._tmdb_worker)
+        self._tmdb_serial += 1
+        return self._tmdb_serial
+
+    def _start_tmdb_worker(self, worker: TmdbWorker | TmdbAddWorker):
+        # Network calls run off the GUI thread; results come back via signals
+        self.tmdb_btn.setEnabled(False)
+        # We hold the reference, so tryTake() never sees a deleted runnable
+        worker.setAutoDelete(False)
+        worker.signals.error.connect(self._on_tmdb_error)
+        if isinstance(worker, TmdbAddWorker):
+            self._tmdb_add_workers[worker.serial] = worker
+        else:
+            self._tmdb_worker = worker
+        self._pool.start(worker)
+
+    def _on_tmdb_error(self, serial: int, message: str):
+        self._tmdb_add_workers.pop(serial, None)
+        if serial != self._tmdb_serial:
+            return
+        self.tmdb_btn.setEnabled(True)
+        self._tmdb_worker = None
+        QMessageBox.warning(self, "TMDB error", message)
+
+    def _on_tmdb_results(self, serial: int, choices: list[TmdbChoice]):
+        if serial != self._tmdb_serial:
             return
+        self.tmdb_btn.setEnabled(True)
+        self._tmdb_worker = None
 
         if not choices:
             QMessageBox.information(self, "TMDB search", "No TMDB results found.")
@@ -655,11 +841,29 @@ class MainWindow(QWidget):
         if not ok:
             return
 
-        r2 = self.service.add_or_show_confirm_tmdb_choice(pick.selected)
+        # Details fetch + insert also go through the pool
+        worker = TmdbAddWorker(self.service, pick.selected, self._next_tmdb_serial())
+        worker.signals.finished.connect(self._on_tmdb_added)
+        self._start_tmdb_worker(worker)
+
+    def _on_tmdb_added(self, serial: int, r2: AddOrShowResult):
+        self._tmdb_add_workers.pop(serial, None)
 
-        if r2.status == "added" and r2.item:
+        # The insert has committed even if a newer search started meanwhile
+        added = r2.status == "added" and r2.item is not None
+        if added:
+            self.model.invalidate_text(r2.item.id)
+            self._genres_dirty = True
             self.refresh_list()
-        elif r2.status == "exists" and r2.item:
+
+        if serial != self._tmdb_serial:
+            return  # a newer job owns the button and the user's attention
+        self.tmdb_btn.setEnabled(True)
+        self._tmdb_worker = None
+
+        if added:
+            return
+        if r2.status == "exists" and r2.item:
             QMessageBox.information(self, "Already in your list", item_to_display_text(r2.item))
         else:
             QMessageBox.warning(self, "Not added", r2.message or "Error")
@@ -671,9 +875,9 @@ class MainWindow(QWidget):
             return
 
         # If exact already exists, just show it (don’t add duplicate)
-        r = self.service.add_or_show_start(typed)
-        if r.status == "exists" and r.item:
-            QMessageBox.information(self, "Already in your list", item_to_display_text(r.item))
+        existing = self.db.get_by_title_norm(norm_title(typed))
+        if existing:
+            QMessageBox.information(self, "Already in your list", item_to_display_text(existing))
             self.input.selectAll()
             return
 
@@ -686,6 +890,8 @@ class MainWindow(QWidget):
         if dlg.exec() == QDialog.Accepted and dlg.local_type:
             it = self.service.add_local(typed, type_=dlg.local_type)  # type: ignore[arg-type]
             QMessageBox.information(self, "Added locally", item_to_display_text(it))
+            self.model.invalidate_text(it.id)
+            self._genres_dirty = True
             self.refresh_list()
 
         self.input.selectAll()
@@ -696,14 +902,14 @@ class MainWindow(QWidget):
             self.refresh_list()
         else:
             # Apply immediately using current text
-            self.on_live_filter(self.input.text())
+            self._run_live_filter()
 
 
-    def on_live_filter(self, text: str):
+    def _run_live_filter(self):
         if not self.live_local.isChecked():
             return  # live mode off
     
-        text = text.strip()
+        text = self.input.text().strip()
         unseen, type_, genre, tag, limit = self.current_filters()
         
         # Build base list first
@@ -712,99 +918,28 @@ class MainWindow(QWidget):
                 unseen_only=unseen, type_=type_, genre=genre, tag=tag, limit=limit
             )
         else:
-            items = self.service.suggestions(text, limit=limit)
-
-            tag_map = self.service.db.get_tags_for_title_ids([it.id for it in items])
-            # Respect filters (suggestions may ignore them)
-            if unseen:
-                items = [it for it in items if not it.seen]
-            if type_:
-                items = [it for it in items if it.type == type_]
-            if genre:
-                items = [it for it in items if genre in it.genres]
-            if tag:
-                items = [
-                    it for it in items
-                    if any(tname == tag for tname, _c in tag_map.get(it.id, []))
-                ]
-    
-        # For coloring by tags (same behavior as refresh_list)
-        tag_map = self.service.db.get_tags_for_title_ids([it.id for it in items])
-    
-        mode = self.sort_by.currentText()
-
-        if mode == "Title (A→Z)":
-            items.sort(key=lambda it: (it.title or "").lower())
-
-        elif mode == "Title (Z→A)":
-            items.sort(key=lambda it: (it.title or "").lower(), reverse=True)
-
-        elif mode == "Runtime (short→long)":
-            items.sort(
-                key=lambda it: (
-                    it.runtime_minutes is None,
-                    it.runtime_minutes or 0,
-                    (it.title or "").lower(),
-                )
+            items = self.service.suggestions_filtered(
+                text, unseen_only=unseen, type_=type_, genre=genre, tag=tag, limit=limit
             )
-
-        elif mode == "Runtime (long→short)":
-            items.sort(
-                key=lambda it: (
-                    it.runtime_minutes is None,
-                    -(it.runtime_minutes or 0),
-                    (it.title or "").lower(),
-                )
-            )
-
-        elif mode == "Year (recent→oldest)":
-            items.sort(
-                key=lambda it: (
-                    it.year is None,
-                    -(it.year or 0),
-                    (it.title or "").lower(),
-                )
-            )
-
-        elif mode == "Year (oldest→recent)":
-            items.sort(
-                key=lambda it: (
-                    it.year is None,
-                    it.year or 0,
-                    (it.title or "").lower(),
-                )
-            )
-
-    
-        self.list.clear()
-        for it in items:
-            w = QListWidgetItem(item_to_display_text(it))
-            w.setData(Qt.ItemDataRole.UserRole, it.id)
-            tags = tag_map.get(it.id, [])
-            base_color = QColor(tags[0][1]) if tags else None
-            self.apply_item_style(w, it.seen, base_color)
-            self.list.addItem(w)
     
-        self.on_selection_changed()
+        items = self._sort_items(items)
 
+        self._populate_list(items)
 
 
 
 
 
-    def on_selection_changed(self):
-        tid = self.selected_title_id()
-        if not tid:
-            self.seen_toggle.setEnabled(False)
-            self.seen_toggle.setText("Mark Seen")
-            return
 
-        it = self.db.get_by_id(tid)
+    def on_selection_changed(self):
+        it = self.selected_item()
         if not it:
             self.seen_toggle.setEnabled(False)
+            self.seen_toggle.setText("Mark Seen")
             return
 
-        is_seen = bool(it["seen"])
+        tid = it.id
+        is_seen = it.seen
         self.seen_toggle.setEnabled(True)
         self.delete_btn.setEnabled(tid is not None)
         self.seen_toggle.setText("Mark Unseen" if is_seen else "Mark Seen")
@@ -812,21 +947,22 @@ class MainWindow(QWidget):
 
 
     def on_toggle_seen(self):
-        tid = self.selected_title_id()
-        if not tid:
+        cur = self.selected_item()
+        if not cur:
             return
-        row = self.db.get_by_id(tid)
-        if not row:
+        tid = cur.id
+        new_seen = not cur.seen
+        it = self.service.set_seen(tid, new_seen)
+        self.model.invalidate_text(tid)
+
+        if new_seen and self.unseen_only.isChecked():
+            # Row no longer matches the filter; re-run the live query if one is active
+            self._apply_filters()
             return
-        new_seen = not bool(row["seen"])
-        self.service.set_seen(tid, new_seen)
-        self.refresh_list()
 
-        # reselect same item if possible
-        for i in range(self.list.count()):
-            if int(self.list.item(i).data(Qt.ItemDataRole.UserRole)) == tid:
-                self.list.setCurrentRow(i)
-                break
+        # Only the toggled row changes; keep the selection where it is
+        self.model.update_item(it)
+        self.on_selection_changed()
 
     def on_random(self):
         unseen, type_, genre, tag, _limit = self.current_filters()
@@ -845,15 +981,16 @@ class MainWindow(QWidget):
         QMessageBox.information(self, "Random pick", item_to_display_text(pick))
 
         # Try highlight it in list
-        for i in range(self.list.count()):
-            if int(self.list.item(i).data(Qt.ItemDataRole.UserRole)) == pick.id:
-                self.list.setCurrentRow(i)
-                self.list.scrollToItem(self.list.item(i))
-                break
+        row = self.model.row_for_id(pick.id)
+        if row >= 0:
+            idx = self.model.index(row)
+            self.list.setCurrentIndex(idx)
+            self.list.scrollTo(idx)
 
 
     def on_manage_tags(self):
         dlg = ManageTagsDialog(self.service, parent=self)
+        dlg.tags_updated.connect(self._refresh_tag_colors)
         dlg.tags_updated.connect(self.refresh_tags)   # refresh dropdown
         dlg.tags_updated.connect(self.refresh_list)   # refresh list colors (optional but nice)
         dlg.exec()
@@ -862,7 +999,7 @@ class MainWindow(QWidget):
         tid = self.selected_title_id()
         if not tid:
             return
-        dlg = SetTagsDialog(self.service, tid, parent=self)
+        dlg = SetTagsDialog(self.service, tid, colors=self._color_cache, parent=self)
         if dlg.exec() == QDialog.Accepted:
             self.service.set_title_tags(tid, dlg.selected_tag_ids())
             self.refresh_list()
@@ -872,6 +1009,7 @@ class MainWindow(QWidget):
 def main():
     app = QApplication(sys.argv)
     w = MainWindow()
+    app.aboutToQuit.connect(w.db.close)
     w.show()
     sys.exit(app.exec())
 
@@ -1,27 +1,44 @@
 # watch_core.py
 from __future__ import annotations
 
+import json
 import os
+import queue
 import random
 import sqlite3
-from dataclasses import dataclass
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional, Literal, Any
+from typing import Iterable, Iterator, Optional, Literal, Any
 import re
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 MediaType = Literal["movie", "show", "youtube"]
 TMDBMediaType = Literal["movie", "tv"]
 _norm_re = re.compile(r"[^a-z0-9]+")
+_YEAR_RE = re.compile(r"\s*(\d{4})")
+# ASCII fast path for norm_title: lowercase alphanumerics, keep "&", blank the rest
+_NORM_TABLE = {c: " " for c in range(128)}
+_NORM_TABLE.update({ord(c): c for c in string.ascii_lowercase + string.digits + "&"})
+_NORM_TABLE.update({ord(c): c.lower() for c in string.ascii_uppercase})
 TMDB_BASE = "https://api.themoviedb.org/3"
+# Bump when init_db's schema script changes so existing databases rerun it
+SCHEMA_VERSION = 2
 
 
 # -------------------------
 # Data shapes (GUI-friendly)
 # -------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TitleItem:
     id: int
     title: str
@@ -31,9 +48,10 @@ class TitleItem:
     year: Optional[int]
     runtime_minutes: Optional[int]
     genres: list[str]
+    tags: list[tuple[int, str, str]] = field(default_factory=list)  # (tag_id, name, color)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TmdbChoice:
     media_type: TMDBMediaType  
     id: int                   
@@ -43,7 +61,7 @@ class TmdbChoice:
 
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AddOrShowResult:
     status: Literal["exists", "needs_choice", "added", "cancelled", "error"]
     item: Optional[TitleItem] = None
@@ -58,30 +76,200 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
+def _year(s: Optional[str]) -> Optional[int]:
+    # Leading YYYY of a TMDB date ("2001-11-16"), if any
+    m = _YEAR_RE.match(s or "")
+    return int(m.group(1)) if m else None
+
+
 def norm_title(s: str) -> str:
+    if s.isascii():
+        return " ".join(s.translate(_NORM_TABLE).replace("&", "and").split())
     s = s.strip().lower()
     s = s.replace("&", "and")
     s = _norm_re.sub(" ", s)
     return " ".join(s.split())
 
+
+# -------------------------
+# SQL
+# -------------------------
+# Statement text must be identical between calls for sqlite3's per-connection
+# statement cache to hit, so static SQL lives here and dynamic SQL is memoized.
+# Genres and tags come back as JSON columns so item lists need no follow-up queries
+_SQL_INLINE_COLS = """
+    (SELECT json_group_array(name) FROM (
+        SELECT ig.name FROM title_genres itg JOIN genres ig ON ig.id = itg.genre_id
+        WHERE itg.title_id = t.id ORDER BY ig.name
+    )) AS genres_json,
+    (SELECT json_group_array(json_object('id', id, 'name', name, 'color', color)) FROM (
+        SELECT itag.id, itag.name, itag.color FROM title_tags itt JOIN tags itag ON itag.id = itt.tag_id
+        WHERE itt.title_id = t.id ORDER BY itag.name
+    )) AS tags_json
+"""
+
+_SQL_GET_BY_ID = "SELECT t.*, " + _SQL_INLINE_COLS + " FROM titles t WHERE t.id = ?"
+_SQL_GET_BY_TITLE_NORM = "SELECT t.*, " + _SQL_INLINE_COLS + " FROM titles t WHERE t.title_norm = ?"
+
+_SQL_INSERT_TITLE = """
+    INSERT INTO titles (title, title_norm, type, seen, tmdb_id, year, runtime_minutes, notes, created_at, updated_at)
+    VALUES (?, ?, ?, 0, ?, ?, ?, ?, ?, ?)
+"""
+
+
+@lru_cache(maxsize=16)
+def _filter_sql(has_unseen: bool, has_type: bool, has_genre: bool, has_tag: bool) -> tuple[str, tuple[str, ...]]:
+    where: list[str] = []
+    joins: list[str] = []
+
+    if has_unseen:
+        where.append("t.seen = 0")
+
+    if has_type:
+        where.append("t.type = ?")
+
+    if has_genre:
+        joins.append(
+            """
+            JOIN title_genres tg ON tg.title_id = t.id
+            JOIN genres g ON g.id = tg.genre_id
+            """
+        )
+        where.append("g.name = ?")
+
+    if has_tag:
+        joins.append(
+            """
+            JOIN title_tags tt ON tt.title_id = t.id
+            JOIN tags tagt ON tagt.id = tt.tag_id
+            """
+        )
+        where.append("tagt.name = ?")
+
+    return " ".join(joins), tuple(where)
+
+
+@lru_cache(maxsize=32)
+def _build_list_titles_sql(has_unseen: bool, has_type: bool, has_genre: bool, has_tag: bool, is_random: bool) -> str:
+    joins, where = _filter_sql(has_unseen, has_type, has_genre, has_tag)
+    # Random picks select only the id so rows skipped by OFFSET skip the JSON columns
+    cols = "t.id" if is_random else "t.*, " + _SQL_INLINE_COLS
+    q = "SELECT DISTINCT " + cols + " FROM titles t " + joins
+    if where:
+        q += " WHERE " + " AND ".join(where)
+    if is_random:
+        # Caller picks a random offset from _build_count_sql; no per-row RANDOM() sort
+        q += " LIMIT 1 OFFSET ?"
+    else:
+        q += " ORDER BY t.updated_at DESC LIMIT ?"
+    return q
+
+
+@lru_cache(maxsize=16)
+def _build_count_sql(has_unseen: bool, has_type: bool, has_genre: bool, has_tag: bool) -> str:
+    joins, where = _filter_sql(has_unseen, has_type, has_genre, has_tag)
+    # Joins can repeat a title, matching the DISTINCT in the list query
+    q = ("SELECT COUNT(DISTINCT t.id) FROM titles t " if joins else "SELECT COUNT(*) FROM titles t ") + joins
+    if where:
+        q += " WHERE " + " AND ".join(where)
+    return q
+
+
+@lru_cache(maxsize=16)
+def _build_search_sql(has_unseen: bool, has_type: bool, has_genre: bool, has_tag: bool) -> str:
+    joins, where = _filter_sql(has_unseen, has_type, has_genre, has_tag)
+    return (
+        "SELECT DISTINCT t.*, " + _SQL_INLINE_COLS
+        + " FROM titles_fts JOIN titles t ON t.id = titles_fts.rowid "
+        + joins
+        + " WHERE " + " AND ".join(("titles_fts MATCH ?",) + where)
+        + " ORDER BY titles_fts.rank LIMIT ?"
+    )
+
+
 # -------------------------
 # DB wrapper
 # -------------------------
 class WatchDB:
     def __init__(self, db_path: Path | str):
         self.db_path = Path(db_path)
-
-    def connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        # One long-lived writer connection; the lock serializes writers
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        # Read-only connections so SELECTs don't queue behind the writer (WAL)
+        self._read_pool: Optional[queue.Queue[sqlite3.Connection]] = None
+        self._read_pool_size = 4
+        # (expires_at, count) for unfiltered random picks; dropped on every write
+        self._title_count: Optional[tuple[float, int]] = None
+
+    def _conn_get(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                conn.execute("PRAGMA cache_size=-20000")
+                conn.execute("PRAGMA foreign_keys=ON")
+                self._conn = conn
+            return self._conn
+
+    def _open_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+        )
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA foreign_keys=ON")
         return conn
 
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        if self._read_pool is None:
+            with self._lock:
+                if self._read_pool is None:
+                    # Writer first: it creates the file and switches it to WAL
+                    self._conn_get()
+                    pool: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=self._read_pool_size)
+                    for _ in range(self._read_pool_size):
+                        pool.put(self._open_reader())
+                    self._read_pool = pool
+
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        # Autocommit connection: each write block is one explicit transaction.
+        # IMMEDIATE takes the write lock up front instead of upgrading mid-block.
+        with self._lock:
+            conn = self._conn_get()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            self._title_count = None
+
     def init_db(self) -> None:
-        with self.connect() as conn:
+        with self._lock:
+            conn = self._conn_get()
+            # Warm start: schema already current, skip the DDL and ANALYZE
+            if conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+                return
+
             conn.executescript(
                 """
-                PRAGMA foreign_keys = ON;
-
                 CREATE TABLE IF NOT EXISTS titles (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     title TEXT NOT NULL,
@@ -111,9 +299,14 @@ class WatchDB:
                     FOREIGN KEY (genre_id) REFERENCES genres(id) ON DELETE CASCADE
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_titles_seen ON titles(seen);
-                CREATE INDEX IF NOT EXISTS idx_titles_type ON titles(type);
+                -- Covered by the (seen|type, updated_at) indexes below
+                DROP INDEX IF EXISTS idx_titles_seen;
+                DROP INDEX IF EXISTS idx_titles_type;
                 CREATE INDEX IF NOT EXISTS idx_title_genres_genre ON title_genres(genre_id);
+                -- list_titles orders by updated_at DESC LIMIT ?; let the index do the sort
+                CREATE INDEX IF NOT EXISTS idx_titles_updated_at ON titles(updated_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_titles_type_updated ON titles(type, updated_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_titles_seen_updated ON titles(seen, updated_at DESC);
                 
 
                 CREATE TABLE IF NOT EXISTS tags (
@@ -137,10 +330,57 @@ class WatchDB:
 
                 """
             )
-            conn.commit()
+
+            # Full-text index over title_norm for word-prefix search
+            has_fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'titles_fts'"
+            ).fetchone()
+            conn.executescript(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS titles_fts USING fts5(
+                    title_norm,
+                    content='titles',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3 4 5'
+                );
+
+                CREATE TRIGGER IF NOT EXISTS titles_ai AFTER INSERT ON titles BEGIN
+                    INSERT INTO titles_fts (rowid, title_norm) VALUES (new.id, new.title_norm);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS titles_ad AFTER DELETE ON titles BEGIN
+                    INSERT INTO titles_fts (titles_fts, rowid, title_norm) VALUES ('delete', old.id, old.title_norm);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS titles_au AFTER UPDATE OF title_norm ON titles BEGIN
+                    INSERT INTO titles_fts (titles_fts, rowid, title_norm) VALUES ('delete', old.id, old.title_norm);
+                    INSERT INTO titles_fts (rowid, title_norm) VALUES (new.id, new.title_norm);
+                END;
+                """
+            )
+            if not has_fts:
+                # Index titles that existed before the FTS table
+                conn.execute("INSERT INTO titles_fts (titles_fts) VALUES ('rebuild')")
+
+            # Planner statistics for the genre/tag joins
+            conn.execute("ANALYZE")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._read_pool is not None:
+                while not self._read_pool.empty():
+                    self._read_pool.get_nowait().close()
+                self._read_pool = None
+            if self._conn is not None:
+                # Refresh stale statistics before the session's connections go away
+                self._conn.execute("PRAGMA optimize")
+                self._conn.close()
+                self._conn = None
 
     def get_by_tmdb(self, tmdb_id: int, type_: str) -> Optional[sqlite3.Row]:
-        with self.connect() as conn:
+        with self._read() as conn:
             return conn.execute(
                 "SELECT * FROM titles WHERE tmdb_id = ? AND type = ?",
                 (tmdb_id, type_),
@@ -148,60 +388,57 @@ class WatchDB:
 
 
     # -------- titles --------
-    def get_by_title_norm(self, title_norm: str) -> Optional[sqlite3.Row]:
-        with self.connect() as conn:
-            return conn.execute(
-                "SELECT * FROM titles WHERE title_norm = ?",
-                (title_norm,),
-            ).fetchone()
+    def get_by_title_norm(self, title_norm: str) -> Optional[TitleItem]:
+        with self._read() as conn:
+            row = conn.execute(_SQL_GET_BY_TITLE_NORM, (title_norm,)).fetchone()
+        return self._row_to_item_json(row) if row else None
 
     def get_by_id(self, title_id: int) -> Optional[sqlite3.Row]:
-        with self.connect() as conn:
-            return conn.execute("SELECT * FROM titles WHERE id = ?", (title_id,)).fetchone()
+        with self._read() as conn:
+            return conn.execute(_SQL_GET_BY_ID, (title_id,)).fetchone()
+
+    @staticmethod
+    def _fts_query(words: list[str]) -> str:
+        # Every word must match as a token prefix: "harry"* "pot"*
+        return " ".join(f'"{w}"*' for w in words)
 
     def search_like(self, title: str, limit: int = 10) -> list[sqlite3.Row]:
         words = norm_title(title).split()
         if not words:
             return []
-        where = " AND ".join(["title_norm LIKE ?"] * len(words))
-        params = [f"%{w}%" for w in words] + [limit]
 
-        with self.connect() as conn:
+        with self._read() as conn:
             return conn.execute(
-                f"SELECT * FROM titles WHERE {where} ORDER BY updated_at DESC LIMIT ?",
-                params,
+                """
+                SELECT t.* FROM titles_fts
+                JOIN titles t ON t.id = titles_fts.rowid
+                WHERE titles_fts MATCH ?
+                ORDER BY titles_fts.rank LIMIT ?
+                """,
+                (self._fts_query(words), limit),
             ).fetchall()
 
 
     def set_seen(self, title_id: int, seen: bool) -> TitleItem:
         ts = now_iso()
-        with self.connect() as conn:
+        with self._write() as conn:
             conn.execute(
                 "UPDATE titles SET seen = ?, updated_at = ? WHERE id = ?",
                 (1 if seen else 0, ts, title_id),
             )
-            conn.commit()
-        return self.get_item(title_id)
+            return self._get_item(conn, title_id)
 
     def insert_local(self, title: str, type_: MediaType = "movie", notes: Optional[str] = None) -> TitleItem:
         title = title.strip()
         tnorm = norm_title(title)
         ts = now_iso()
 
-        with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO titles (title, title_norm, type, seen, tmdb_id, year, runtime_minutes, notes, created_at, updated_at)
-                VALUES (?, ?, ?, 0, NULL, NULL, NULL, ?, ?, ?)
-                """,
-                (title, tnorm, type_, notes, ts, ts),
+        with self._write() as conn:
+            cur = conn.execute(
+                _SQL_INSERT_TITLE,
+                (title, tnorm, type_, None, None, None, notes, ts, ts),
             )
-            conn.commit()
-
-            row = conn.execute("SELECT id FROM titles WHERE title_norm = ?", (tnorm,)).fetchone()
-            if not row:
-                raise RuntimeError("Failed to insert local title.")
-            return self.get_item(int(row["id"]))
+            return self._get_item(conn, int(cur.lastrowid))
 
     def insert_tmdb(
         self,
@@ -216,39 +453,28 @@ class WatchDB:
         tnorm = norm_title(title)
         ts = now_iso()
 
-        with self.connect() as conn:
+        with self._write() as conn:
+            # One lookup for both duplicate rules; a TMDB id match wins over a title match
             existing = conn.execute(
-                "SELECT id FROM titles WHERE tmdb_id = ? AND type = ?",
-                (tmdb_id, type_),
-            ).fetchone()
-            if existing:
-                return self.get_item(int(existing["id"])), False
-
-            existing = conn.execute(
-                "SELECT id FROM titles WHERE title_norm = ?",
-                (tnorm,),
+                """
+                SELECT id FROM titles
+                WHERE (tmdb_id = ? AND type = ?) OR title_norm = ?
+                ORDER BY (tmdb_id = ? AND type = ?) DESC
+                LIMIT 1
+                """,
+                (tmdb_id, type_, tnorm, tmdb_id, type_),
             ).fetchone()
             if existing:
-                return self.get_item(int(existing["id"])), False
+                return self._get_item(conn, int(existing["id"])), False
 
-            conn.execute(
-                """
-                INSERT INTO titles (title, title_norm, type, seen, tmdb_id, year, runtime_minutes, notes, created_at, updated_at)
-                VALUES (?, ?, ?, 0, ?, ?, ?, NULL, ?, ?)
-                """,
-                (title, tnorm, type_, tmdb_id, year, runtime_minutes, ts, ts),
+            cur = conn.execute(
+                _SQL_INSERT_TITLE,
+                (title, tnorm, type_, tmdb_id, year, runtime_minutes, None, ts, ts),
             )
-            conn.commit()
-
-            row = conn.execute("SELECT id FROM titles WHERE tmdb_id = ? AND type = ?", (tmdb_id, type_)).fetchone()
-            if not row:
-                raise RuntimeError("Failed to insert TMDB title.")
-            title_id = int(row["id"])
+            title_id = int(cur.lastrowid)
 
             self._set_title_genres(conn, title_id, genres)
-            conn.commit()
-
-        return self.get_item(title_id), True
+            return self._get_item(conn, title_id), True
 
 
     def list_titles(
@@ -259,57 +485,18 @@ class WatchDB:
             tag: Optional[str] = None,
             limit: int = 100,
     ) -> list[TitleItem]:
-        where: list[str] = []
-        args: list[Any] = []
-        joins: list[str] = []
-    
-        if unseen_only:
-            where.append("t.seen = 0")
-    
-        if type_:
-            where.append("t.type = ?")
-            args.append(type_)
-    
-        if genre:
-            joins.append(
-                """
-                JOIN title_genres tg ON tg.title_id = t.id
-                JOIN genres g ON g.id = tg.genre_id
-                """
-            )
-            where.append("g.name = ?")
-            args.append(genre.strip())
-    
-        if tag:
-            joins.append(
-                """
-                JOIN title_tags tt ON tt.title_id = t.id
-                JOIN tags tagt ON tagt.id = tt.tag_id
-                """
-            )
-            where.append("tagt.name = ?")
-            args.append(tag.strip())
-    
-        q = "SELECT DISTINCT t.* FROM titles t " + " ".join(joins)
-        if where:
-            q += " WHERE " + " AND ".join(where)
-        q += " ORDER BY t.updated_at DESC LIMIT ?"
+        flags, args = self._filter_args(unseen_only, type_, genre, tag)
+        q = _build_list_titles_sql(*flags, False)
         args.append(limit)
     
-        with self.connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(q, args).fetchall()
-    
-            ids = [int(r["id"]) for r in rows]
-            genres_map = self._fetch_genres_for_title_ids(conn, ids)
-    
-        return [
-            self._row_to_item_with_genres(r, genres_map.get(int(r["id"]), []))
-            for r in rows
-        ]
+
+        return [self._row_to_item_json(r) for r in rows]
 
 
     def list_genres(self) -> list[tuple[str, int]]:
-        with self.connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT g.name, COUNT(*) AS count
@@ -328,137 +515,93 @@ class WatchDB:
             genre: Optional[str] = None,
             tag: Optional[str] = None,
     ) -> Optional[TitleItem]:
-        where: list[str] = []
-        args: list[Any] = []
-        joins: list[str] = []
-    
-        if unseen_only:
-            where.append("t.seen = 0")
-    
-        if type_:
-            where.append("t.type = ?")
-            args.append(type_)
-    
-        if genre:
-            joins.append(
-                """
-                JOIN title_genres tg ON tg.title_id = t.id
-                JOIN genres g ON g.id = tg.genre_id
-                """
-            )
-            where.append("g.name = ?")
-            args.append(genre.strip())
-    
-        if tag:
-            joins.append(
-                """
-                JOIN title_tags tt ON tt.title_id = t.id
-                JOIN tags tagt ON tagt.id = tt.tag_id
-                """
-            )
-            where.append("tagt.name = ?")
-            args.append(tag.strip())
-    
-        q = "SELECT DISTINCT t.* FROM titles t " + " ".join(joins)
-        if where:
-            q += " WHERE " + " AND ".join(where)
-    
-        q += " ORDER BY RANDOM() LIMIT 1"
-    
-        with self.connect() as conn:
-            row = conn.execute(q, args).fetchone()
+        flags, args = self._filter_args(unseen_only, type_, genre, tag)
+        q = _build_list_titles_sql(*flags, True)
+
+        with self._read() as conn:
+            if any(flags):
+                count = conn.execute(_build_count_sql(*flags), args).fetchone()[0]
+            else:
+                count = self._unfiltered_count(conn)
+            if not count:
+                return None
+
+            row = conn.execute(q, [*args, random.randrange(count)]).fetchone()
             if not row:
                 return None
-    
-            genres_map = self._fetch_genres_for_title_ids(conn, [int(row["id"])])
-            genres = genres_map.get(int(row["id"]), [])
-    
-        return self._row_to_item_with_genres(row, genres)
+            return self._get_item(conn, int(row["id"]))
 
 
+    def _unfiltered_count(self, conn: sqlite3.Connection) -> int:
+        now = time.monotonic()
+        cached = self._title_count
+        if cached and cached[0] > now:
+            return cached[1]
+        count = conn.execute("SELECT COUNT(*) FROM titles").fetchone()[0]
+        self._title_count = (now + 1.0, count)
+        return count
+
     def get_item(self, title_id: int) -> TitleItem:
-        row = self.get_by_id(title_id)
+        with self._read() as conn:
+            return self._get_item(conn, title_id)
+
+    def _get_item(self, conn: sqlite3.Connection, title_id: int) -> TitleItem:
+        # Row + genres on the caller's connection (sees its uncommitted writes)
+        row = conn.execute(_SQL_GET_BY_ID, (title_id,)).fetchone()
         if not row:
             raise RuntimeError("Title not found.")
-        return self._row_to_item(row)
+        return self._row_to_item_json(row)
 
 
     def delete_title(self, title_id: int) -> None:
-        with self.connect() as conn:
+        with self._write() as conn:
             conn.execute("DELETE FROM titles WHERE id = ?", (title_id,))
-            conn.commit()
 
-    # -------- genres internal --------
-    def _get_or_create_genre_id(self, conn: sqlite3.Connection, name: str) -> int:
-        name = name.strip()
-        row = conn.execute("SELECT id FROM genres WHERE name = ?", (name,)).fetchone()
-        if row:
-            return int(row["id"])
-        conn.execute("INSERT INTO genres (name) VALUES (?)", (name,))
-        row = conn.execute("SELECT id FROM genres WHERE name = ?", (name,)).fetchone()
-        if not row:
-            raise RuntimeError("Failed to create genre.")
-        return int(row["id"])
+    # -------- filters internal --------
+    def _filter_args(
+            self,
+            unseen_only: bool,
+            type_: Optional[MediaType],
+            genre: Optional[str],
+            tag: Optional[str],
+    ) -> tuple[tuple[bool, bool, bool, bool], list[Any]]:
+        # Flags select the cached SQL shape; args bind in the same order
+        args: list[Any] = []
+        if type_:
+            args.append(type_)
+        if genre:
+            args.append(genre.strip())
+        if tag:
+            args.append(tag.strip())
+        return (bool(unseen_only), bool(type_), bool(genre), bool(tag)), args
 
+    # -------- genres internal --------
     def _set_title_genres(self, conn: sqlite3.Connection, title_id: int, genre_names: Iterable[str]) -> None:
         conn.execute("DELETE FROM title_genres WHERE title_id = ?", (title_id,))
-        for g in genre_names:
-            if not g:
-                continue
-            gid = self._get_or_create_genre_id(conn, g)
-            conn.execute(
-                "INSERT OR IGNORE INTO title_genres (title_id, genre_id) VALUES (?, ?)",
-                (title_id, gid),
-            )
-
-    def _fetch_title_genres(self, conn: sqlite3.Connection, title_id: int) -> list[str]:
-        rows = conn.execute(
-            """
-            SELECT g.name
-            FROM genres g
-            JOIN title_genres tg ON tg.genre_id = g.id
-            WHERE tg.title_id = ?
-            ORDER BY g.name ASC
-            """,
-            (title_id,),
-        ).fetchall()
-        return [r["name"] for r in rows]
-
-    def _row_to_item(self, row: sqlite3.Row) -> TitleItem:
-        with self.connect() as conn:
-            genres = self._fetch_title_genres(conn, int(row["id"]))
-        return TitleItem(
-            id=int(row["id"]),
-            title=str(row["title"]),
-            type=row["type"],
-            seen=bool(row["seen"]),
-            tmdb_id=int(row["tmdb_id"]) if row["tmdb_id"] is not None else None,
-            year=int(row["year"]) if row["year"] is not None else None,
-            runtime_minutes=int(row["runtime_minutes"]) if row["runtime_minutes"] is not None else None,
-            genres=genres,
+        names = list(dict.fromkeys(g.strip() for g in genre_names if g and g.strip()))
+        if not names:
+            return
+
+        # Upsert all genres, resolve their ids in one query, then link them
+        conn.executemany("INSERT OR IGNORE INTO genres (name) VALUES (?)", [(n,) for n in names])
+        qmarks = ",".join(["?"] * len(names))
+        rows = conn.execute(f"SELECT id FROM genres WHERE name IN ({qmarks})", names).fetchall()
+        conn.executemany(
+            "INSERT OR IGNORE INTO title_genres (title_id, genre_id) VALUES (?, ?)",
+            [(title_id, int(r["id"])) for r in rows],
         )
 
-    def _fetch_genres_for_title_ids(self, conn: sqlite3.Connection, title_ids: list[int]) -> dict[int, list[str]]:
-        if not title_ids:
-            return {}
-        qmarks = ",".join(["?"] * len(title_ids))
-        rows = conn.execute(
-            f"""
-            SELECT tg.title_id, g.name
-            FROM title_genres tg
-            JOIN genres g ON g.id = tg.genre_id
-            WHERE tg.title_id IN ({qmarks})
-            ORDER BY g.name ASC
-            """,
-            title_ids,
-        ).fetchall()
-    
-        out: dict[int, list[str]] = {}
-        for r in rows:
-            out.setdefault(int(r["title_id"]), []).append(str(r["name"]))
-        return out
+    def _row_to_item_json(self, row: sqlite3.Row) -> TitleItem:
+        # Rows built with _SQL_INLINE_COLS carry genres and tags as JSON
+        tags = [(int(t["id"]), str(t["name"]), str(t["color"])) for t in json.loads(row["tags_json"] or "[]")]
+        return self._row_to_item_with_genres(row, json.loads(row["genres_json"] or "[]"), tags)
 
-    def _row_to_item_with_genres(self, row: sqlite3.Row, genres: list[str]) -> TitleItem:
+    def _row_to_item_with_genres(
+            self,
+            row: sqlite3.Row,
+            genres: list[str],
+            tags: Optional[list[tuple[int, str, str]]] = None,
+    ) -> TitleItem:
         return TitleItem(
             id=int(row["id"]),
             title=str(row["title"]),
@@ -468,33 +611,36 @@ class WatchDB:
             year=int(row["year"]) if row["year"] is not None else None,
             runtime_minutes=int(row["runtime_minutes"]) if row["runtime_minutes"] is not None else None,
             genres=genres,
+            tags=tags or [],
         )
 
-    def search_like_items(self, title: str, limit: int = 10) -> list[TitleItem]:
+    def search_like_items(
+            self,
+            title: str,
+            limit: int = 10,
+            unseen_only: bool = False,
+            type_: Optional[MediaType] = None,
+            genre: Optional[str] = None,
+            tag: Optional[str] = None,
+    ) -> list[TitleItem]:
         words = norm_title(title).split()
         if not words:
             return []
     
-        where = " AND ".join(["t.title_norm LIKE ?"] * len(words))
-        params = [f"%{w}%" for w in words] + [limit]
-    
-        with self.connect() as conn:
-            rows = conn.execute(
-                f"SELECT t.* FROM titles t WHERE {where} ORDER BY t.updated_at DESC LIMIT ?",
-                params,
-            ).fetchall()
-    
-            ids = [int(r["id"]) for r in rows]
-            genres_map = self._fetch_genres_for_title_ids(conn, ids)
+        flags, args = self._filter_args(unseen_only, type_, genre, tag)
+        params = [self._fts_query(words)] + args + [limit]
     
-        return [self._row_to_item_with_genres(r, genres_map.get(int(r["id"]), [])) for r in rows]
+        with self._read() as conn:
+            rows = conn.execute(_build_search_sql(*flags), params).fetchall()
+
+        return [self._row_to_item_json(r) for r in rows]
 
 
 
     # -------- tags internal --------
 
     def list_tags(self) -> list[tuple[int, str, str]]:
-        with self.connect() as conn:
+        with self._read() as conn:
             rows = conn.execute("SELECT id, name, color FROM tags ORDER BY name ASC").fetchall()
         return [(int(r["id"]), r["name"], r["color"]) for r in rows]
 
@@ -502,33 +648,29 @@ class WatchDB:
         name = name.strip()
         color = color.strip()
         try:
-            with self.connect() as conn:
+            with self._write() as conn:
                 cur = conn.execute(
                     "INSERT INTO tags (name, color) VALUES (?, ?)",
                     (name, color),
                 )
-                conn.commit()
                 return int(cur.lastrowid)
         except sqlite3.IntegrityError:
             raise ValueError(f"Tag '{name}' already exists.")
 
     def delete_tag(self, tag_id: int) -> None:
-        with self.connect() as conn:
+        with self._write() as conn:
             conn.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
-            conn.commit()
 
     def set_title_tags(self, title_id: int, tag_ids: list[int]) -> None:
-        with self.connect() as conn:
+        with self._write() as conn:
             conn.execute("DELETE FROM title_tags WHERE title_id = ?", (title_id,))
-            for tid in tag_ids:
-                conn.execute(
-                    "INSERT OR IGNORE INTO title_tags (title_id, tag_id) VALUES (?, ?)",
-                    (title_id, tid),
-                )
-            conn.commit()
+            conn.executemany(
+                "INSERT OR IGNORE INTO title_tags (title_id, tag_id) VALUES (?, ?)",
+                [(title_id, tid) for tid in tag_ids],
+            )
 
     def get_title_tags(self, title_id: int) -> list[tuple[str, str]]:
-        with self.connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT t.name, t.color
@@ -541,23 +683,31 @@ class WatchDB:
             ).fetchall()
         return [(r["name"], r["color"]) for r in rows]
 
-    def get_tags_for_title_ids(self, title_ids: list[int]) -> dict[int, list[tuple[str, str]]]:
+    def get_title_tag_ids(self, title_id: int) -> list[int]:
+        with self._read() as conn:
+            rows = conn.execute(
+                "SELECT tag_id FROM title_tags WHERE title_id = ?",
+                (title_id,),
+            ).fetchall()
+        return [int(r["tag_id"]) for r in rows]
+
+    def get_tags_for_title_ids(self, title_ids: list[int]) -> dict[int, list[tuple[int, str, str]]]:
         if not title_ids:
             return {}
         qmarks = ",".join(["?"] * len(title_ids))
         sql = f"""
-        SELECT tt.title_id, t.name, t.color
+        SELECT tt.title_id, t.id, t.name, t.color
         FROM title_tags tt
         JOIN tags t ON t.id = tt.tag_id
         WHERE tt.title_id IN ({qmarks})
         ORDER BY t.name ASC
         """
-        with self.connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(sql, title_ids).fetchall()
 
-        out: dict[int, list[tuple[str, str]]] = {}
+        out: dict[int, list[tuple[int, str, str]]] = {}
         for r in rows:
-            out.setdefault(int(r["title_id"]), []).append((str(r["name"]), str(r["color"])))
+            out.setdefault(int(r["title_id"]), []).append((int(r["id"]), str(r["name"]), str(r["color"])))
         return out
 
 
@@ -565,12 +715,11 @@ class WatchDB:
         name = name.strip()
         color = color.strip()
         try:
-            with self.connect() as conn:
+            with self._write() as conn:
                 conn.execute(
                     "UPDATE tags SET name = ?, color = ? WHERE id = ?",
                     (name, color, tag_id),
                 )
-                conn.commit()
         except sqlite3.IntegrityError:
             raise ValueError(f"Tag '{name}' already exists.")
 
@@ -582,66 +731,92 @@ class WatchDB:
 # TMDB client (no prompting/printing)
 # -------------------------
 class TMDBClient:
+    SEARCH_TTL = 60.0
+    DETAILS_TTL = 600.0
+    CACHE_MAXSIZE = 512
+
     def __init__(self, token_env: str = "TMDB_TOKEN"):
         self.token_env = token_env
+        # Keep-alive session: later calls skip the TCP/TLS handshake
+        self._session = requests.Session()
+        # Room for the concurrent movie/TV searches; retry rate limits and 5xx with backoff.
+        # Read timeouts are not retried so a stalled network costs one timeout, not four.
+        retry = Retry(
+            total=3, connect=1, read=0, status=3,
+            backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        self._cached_headers: Optional[dict] = None
+        # Movie and TV searches are independent; run them side by side
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        # LRU of (path, params json) -> (expires_at, parsed JSON); type-ahead repeats queries
+        self._cache: dict[tuple[str, str], tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
 
     def _headers(self) -> dict:
-        token = os.getenv(self.token_env)
-        if not token:
-            raise RuntimeError(f"Missing {self.token_env} env var (TMDB v4 Read Access Token).")
-        return {"Authorization": f"Bearer {token}", "Accept": "application/json"}
-
-    def search_movie(self, query: str, language: str = "en-US") -> list[dict]:
-        r = requests.get(
-            f"{TMDB_BASE}/search/movie",
+        if self._cached_headers is None:
+            token = os.getenv(self.token_env)
+            if not token:
+                raise RuntimeError(f"Missing {self.token_env} env var (TMDB v4 Read Access Token).")
+            self._cached_headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+        return self._cached_headers
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _get_json(self, path: str, params: dict, ttl: float) -> Any:
+        key = (path, json.dumps(params, sort_keys=True))
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._cache.pop(key, None)
+            if hit and hit[0] > now:
+                # Re-insert so dict order tracks recency (LRU)
+                self._cache[key] = hit
+                return hit[1]
+
+        r = self._session.get(
+            f"{TMDB_BASE}{path}",
             headers=self._headers(),
-            params={"query": query, "include_adult": "false", "language": language},
+            params=params,
             timeout=15,
         )
         r.raise_for_status()
-        return r.json().get("results", [])
+        data = r.json()
+
+        with self._cache_lock:
+            if len(self._cache) >= self.CACHE_MAXSIZE:
+                # Drop the least recently used entry
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = (now + ttl, data)
+        return data
+
+    def search_movie(self, query: str, language: str = "en-US") -> list[dict]:
+        params = {"query": query, "include_adult": "false", "language": language}
+        return self._get_json("/search/movie", params, self.SEARCH_TTL).get("results", [])
 
     def search_tv(self, query: str, language: str = "en-US") -> list[dict]:
-        r = requests.get(
-            f"{TMDB_BASE}/search/tv",
-            headers=self._headers(),
-            params={"query": query, "include_adult": "false", "language": language},
-            timeout=15,
-        )
-        r.raise_for_status()
-        return r.json().get("results", [])
+        params = {"query": query, "include_adult": "false", "language": language}
+        return self._get_json("/search/tv", params, self.SEARCH_TTL).get("results", [])
 
     def movie_details(self, movie_id: int, language: str = "en-US") -> dict:
-        r = requests.get(
-            f"{TMDB_BASE}/movie/{movie_id}",
-            headers=self._headers(),
-            params={"language": language},
-            timeout=15,
-        )
-        r.raise_for_status()
-        return r.json()
+        return self._get_json(f"/movie/{movie_id}", {"language": language}, self.DETAILS_TTL)
 
     def tv_details(self, tv_id: int, language: str = "en-US") -> dict:
-        r = requests.get(
-            f"{TMDB_BASE}/tv/{tv_id}",
-            headers=self._headers(),
-            params={"language": language},
-            timeout=15,
-        )
-        r.raise_for_status()
-        return r.json()
+        return self._get_json(f"/tv/{tv_id}", {"language": language}, self.DETAILS_TTL)
 
     def search_any(self, query: str, language: str = "en-US", limit: int = 8) -> list[TmdbChoice]:
-        movies = self.search_movie(query, language=language)[:10]
-        tvs = self.search_tv(query, language=language)[:10]
+        fut_m = self._executor.submit(self.search_movie, query, language)
+        fut_t = self._executor.submit(self.search_tv, query, language)
+        movies = fut_m.result()[:10]
+        tvs = fut_t.result()[:10]
 
         merged: list[dict] = []
         for r in movies:
             if not r.get("id"):
                 continue
             title = (r.get("title") or "?").strip()
-            date = (r.get("release_date") or "").strip()
-            year = int(date[:4]) if date[:4].isdigit() else None
+            year = _year(r.get("release_date"))
             merged.append(
                 dict(
                     media_type="movie",
@@ -658,8 +833,7 @@ class TMDBClient:
             if not r.get("id"):
                 continue
             title = (r.get("name") or "?").strip()
-            date = (r.get("first_air_date") or "").strip()
-            year = int(date[:4]) if date[:4].isdigit() else None
+            year = _year(r.get("first_air_date"))
             merged.append(
                 dict(
                     media_type="tv",
@@ -690,16 +864,14 @@ class TMDBClient:
         if choice.media_type == "movie":
             details = self.movie_details(choice.id, language=language)
             title = (details.get("title") or choice.title).strip()
-            date = (details.get("release_date") or "").strip()
-            year = int(date[:4]) if date[:4].isdigit() else None
+            year = _year(details.get("release_date"))
             runtime = details.get("runtime")
             genres = [g.get("name") for g in (details.get("genres") or []) if g.get("name")]
             return title, "movie", choice.id, year, runtime, genres
 
         details = self.tv_details(choice.id, language=language)
         title = (details.get("name") or choice.title).strip()
-        date = (details.get("first_air_date") or "").strip()
-        year = int(date[:4]) if date[:4].isdigit() else None
+        year = _year(details.get("first_air_date"))
         ert = details.get("episode_run_time") or []
         runtime = int(ert[0]) if ert and isinstance(ert[0], int) else None
         genres = [g.get("name") for g in (details.get("genres") or []) if g.get("name")]
@@ -717,7 +889,7 @@ class WatchService:
     def add_or_show_start(self, typed_title: str, language: str = "en-US") -> AddOrShowResult:
         existing = self.db.get_by_title_norm(norm_title(typed_title))
         if existing:
-            return AddOrShowResult(status="exists", item=self.db._row_to_item(existing))
+            return AddOrShowResult(status="exists", item=existing)
 
         if not self.tmdb:
             return AddOrShowResult(status="error", message="TMDB client not configured.")
@@ -804,6 +976,19 @@ class WatchService:
 
     def suggestions(self, typed: str, limit: int = 8) -> list[TitleItem]:
         return self.db.search_like_items(typed, limit=limit)
+
+    def suggestions_filtered(
+        self,
+        typed: str,
+        unseen_only: bool = False,
+        type_: Optional[MediaType] = None,
+        genre: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 8,
+    ) -> list[TitleItem]:
+        return self.db.search_like_items(
+            typed, limit=limit, unseen_only=unseen_only, type_=type_, genre=genre, tag=tag
+        )
     
     def list_tags(self):
         return self.db.list_tags()
@@ -824,6 +1009,9 @@ class WatchService:
     def get_title_tags(self, title_id: int):
         return self.db.get_title_tags(title_id)
 
+    def get_title_tag_ids(self, title_id: int) -> list[int]:
+        return self.db.get_title_tag_ids(title_id)
+
     def get_tags_for_title_ids(self, title_ids: list[int]):
         return self.db.get_tags_for_title_ids(title_ids)
 